@@ -3,10 +3,15 @@
 This module provides utilities for managing database sessions and migrations.
 """
 
+import asyncio
+import json
+import threading
 import uuid
+import zlib
 from collections.abc import AsyncGenerator, Generator
 from contextlib import asynccontextmanager, contextmanager
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any, Optional
 
 from pydantic import TypeAdapter
@@ -14,12 +19,18 @@ from pydantic_ai.messages import RetryPromptPart
 from pydantic_ai.usage import Usage
 from sqlalchemy import (
     JSON,
+    Connection,
     Engine,
     ForeignKey,
+    Index,
+    LargeBinary,
     String,
     TypeDecorator,
     create_engine,
-    inspect,
+    event,
+    func,
+    insert,
+    select,
 )
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import (
@@ -28,22 +39,36 @@ from sqlalchemy.orm import (
     Session,
     mapped_column,
     relationship,
+    selectinload,
 )
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool, QueuePool, StaticPool
 
 from marvin.settings import settings
+from marvin.utilities.logging import get_logger
 
 from .engine.llm import Message
 
+logger = get_logger(__name__)
+
+# TypeAdapters build their validator and serializer at construction, so this
+# cost is paid at import rather than on the first insert. Don't enable
+# `defer_build` for these: they are used on every message write.
 message_adapter: TypeAdapter[Message] = TypeAdapter(Message)
 usage_adapter: TypeAdapter[Usage] = TypeAdapter(Usage)
 
-# Module-level cache for engines
-_engine_cache: dict[str, Engine] = {}
-_async_engine_cache: dict[str, AsyncEngine] = {}
+# Engines set via `set_engine`/`set_async_engine`, used instead of the built ones
+_engine_override: Engine | None = None
+_async_engine_override: AsyncEngine | None = None
+
+# Execution option that marks a connection as intending to write
+_BEGIN_IMMEDIATE = "marvin_begin_immediate"
+
+# Background task that periodically refreshes query planner statistics
+OPTIMIZE_INTERVAL_SECONDS = 900
+_optimize_task: asyncio.Task[None] | None = None
 
 
-def serialize_message(message: Message) -> str:
+def _prepare_message(message: Message) -> Message:
     """
     The `ctx` field in the `RetryPromptPart` is optionally dict[str, Any], which is not always serializable.
     """
@@ -54,66 +79,202 @@ def serialize_message(message: Message) -> str:
                     content["ctx"] = {
                         k: str(v) for k, v in (content.get("ctx", None) or {}).items()
                     }
-    return message_adapter.dump_python(message, mode="json")
+    return message
 
 
-def get_engine() -> Engine:
-    """Get the SQLAlchemy engine for sync operations.
+def serialize_message(message: Message) -> dict[str, Any]:
+    """Serialize a message to JSON-compatible Python objects."""
+    return message_adapter.dump_python(_prepare_message(message), mode="json")
 
-    For in-memory databases (:memory:), this uses StaticPool to maintain
-    a single connection that can be shared with the async engine.
+
+def _dump_message_json(message: Message) -> bytes:
+    """Serialize a message straight to JSON bytes.
+
+    `CompressedJSON` columns compress the bytes without re-encoding them. Only
+    use this for Core inserts: an ORM attribute holding the bytes would be
+    returned as-is by later reads in the same session.
     """
-    if "default" not in _engine_cache:
-        is_memory_db = settings.database_url == ":memory:"
+    return message_adapter.dump_json(_prepare_message(message))
+
+
+def _set_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+    """Configure a new SQLite connection for a write-heavy local workload.
+
+    Only settings that apply per connection are set here. WAL mode is stored
+    in the database file and is enabled once by `ensure_tables_exist`; with
+    WAL, `synchronous=NORMAL` avoids an fsync on every commit.
+
+    The driver's implicit transaction handling is disabled so that
+    `_begin_transaction` controls how each transaction starts.
+    """
+    dbapi_connection.isolation_level = None
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256MB
+    cursor.execute("PRAGMA cache_size=-64000")  # 64MB
+    cursor.close()
+
+
+def _begin_transaction(conn: Connection) -> None:
+    """Start a transaction, taking the write lock up front for write sessions.
+
+    `BEGIN IMMEDIATE` avoids the deadlock that occurs when two deferred
+    transactions both try to upgrade from a read to a write lock.
+    """
+    if conn.get_execution_options().get(_BEGIN_IMMEDIATE):
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+    else:
+        conn.exec_driver_sql("BEGIN")
+
+
+def _configure_sqlite_engine(engine: Engine) -> None:
+    """Attach connection and transaction listeners to a file-based engine."""
+    event.listen(engine, "connect", _set_sqlite_pragmas)
+    event.listen(engine, "begin", _begin_transaction)
+
+
+async def _optimize_periodically() -> None:
+    """Run `PRAGMA optimize` every `OPTIMIZE_INTERVAL_SECONDS`.
+
+    Stops once the engine is replaced via `set_async_engine`.
+    """
+    while True:
+        await asyncio.sleep(OPTIMIZE_INTERVAL_SECONDS)
+        if _async_engine_override is not None:
+            return
+        try:
+            async with _build_async_engine().begin() as conn:
+                await conn.exec_driver_sql("PRAGMA optimize")
+        except Exception as e:
+            logger.debug("Periodic PRAGMA optimize failed: %s", e)
+
+
+def _start_optimize_task() -> None:
+    """Start the periodic optimize task on the running loop, if there is one.
+
+    This is called once, when the async engine is built. Only the main
+    thread's loop is used; loops created by `run_sync_in_thread` are
+    short-lived and would be closed with the task still pending.
+    """
+    global _optimize_task
+    if _optimize_task is not None and not _optimize_task.done():
+        return
+    if threading.current_thread() is not threading.main_thread():
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    _optimize_task = loop.create_task(_optimize_periodically())
+
+
+@lru_cache(maxsize=1)
+def _build_engine() -> Engine:
+    """Build the sync engine from settings. Cached until `reset_engines`."""
+    is_memory_db = settings.database_url == ":memory:"
+    if is_memory_db:
         engine = create_engine(
             f"sqlite:///{settings.database_url}",
             echo=False,
-            poolclass=StaticPool if is_memory_db else None,
+            poolclass=StaticPool,
+            connect_args={"check_same_thread": False},
+        )
+    else:
+        # SQLite allows a single writer, so one pooled connection is enough.
+        # Recycle it so long-lived processes don't hold WAL read marks forever.
+        engine = create_engine(
+            f"sqlite:///{settings.database_url}",
+            echo=False,
+            poolclass=QueuePool,
+            pool_size=1,
+            pool_recycle=3600,
+            connect_args={"check_same_thread": False},
+        )
+        _configure_sqlite_engine(engine)
+    return engine
+
+
+@lru_cache(maxsize=1)
+def _build_async_engine() -> AsyncEngine:
+    """Build the async engine from settings. Cached until `reset_engines`."""
+    is_memory_db = settings.database_url == ":memory:"
+
+    if is_memory_db:
+        # For in-memory databases, share connection with sync engine
+        sync_engine = get_engine()
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{settings.database_url}",
+            echo=False,
+            poolclass=StaticPool,
+            connect_args={"check_same_thread": False},
+            creator=lambda: sync_engine.raw_connection(),
+        )
+    else:
+        # aiosqlite runs each connection on a non-daemon thread, so pooled
+        # connections would keep the interpreter from exiting. NullPool closes
+        # every connection when its session ends, so none are left holding
+        # WAL read marks in long-lived processes.
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{settings.database_url}",
+            echo=False,
+            poolclass=NullPool,
             connect_args={"check_same_thread": False},
         )
-        _engine_cache["default"] = engine
+        _configure_sqlite_engine(engine.sync_engine)
+        _start_optimize_task()
+    return engine
 
-    return _engine_cache["default"]
 
+def get_engine() -> Engine:
+    """Get the SQLAlchemy engine for sync operations.
 
-def get_async_engine():
+    For in-memory databases (:memory:), this uses StaticPool to maintain
+    a single connection that can be shared with the async engine. File-based
+    databases are configured for WAL mode on every new connection.
+    """
+    if _engine_override is not None:
+        return _engine_override
+    return _build_engine()
+
+
+def get_async_engine() -> AsyncEngine:
     """Get the SQLAlchemy engine for async operations.
 
     For in-memory databases (:memory:), this reuses the sync engine's connection
-    to ensure both engines share the same database state.
+    to ensure both engines share the same database state. For file-based
+    databases, building the engine starts a background task that runs
+    `PRAGMA optimize` on the running event loop.
     """
-    if "default" not in _async_engine_cache:
-        is_memory_db = settings.database_url == ":memory:"
-
-        if is_memory_db:
-            # For in-memory databases, share connection with sync engine
-            sync_engine = get_engine()
-            engine = create_async_engine(
-                f"sqlite+aiosqlite:///{settings.database_url}",
-                echo=False,
-                poolclass=StaticPool,
-                connect_args={"check_same_thread": False},
-                creator=lambda: sync_engine.raw_connection(),
-            )
-        else:
-            engine = create_async_engine(
-                f"sqlite+aiosqlite:///{settings.database_url}",
-                echo=False,
-                connect_args={"check_same_thread": False},
-            )
-        _async_engine_cache["default"] = engine
-
-    return _async_engine_cache["default"]
+    if _async_engine_override is not None:
+        return _async_engine_override
+    return _build_async_engine()
 
 
 def set_engine(engine: Engine):
     """Set the SQLAlchemy engine for sync operations."""
-    _engine_cache["default"] = engine
+    global _engine_override
+    _engine_override = engine
 
 
 def set_async_engine(engine: AsyncEngine):
     """Set the SQLAlchemy engine for async operations."""
-    _async_engine_cache["default"] = engine
+    global _async_engine_override
+    _async_engine_override = engine
+
+
+def reset_engines():
+    """Discard engines set or built so far.
+
+    The next call to `get_engine` or `get_async_engine` builds a new engine
+    from the current settings.
+    """
+    global _engine_override, _async_engine_override
+    _engine_override = None
+    _async_engine_override = None
+    _build_engine.cache_clear()
+    _build_async_engine.cache_clear()
 
 
 def utc_now() -> datetime:
@@ -121,6 +282,112 @@ def utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
+def _server_utc_now() -> Any:
+    """Column default that SQLite fills in with the current UTC time.
+
+    SQLite's `'now'` is UTC, and `%f` keeps millisecond precision (unlike
+    `CURRENT_TIMESTAMP`, which stops at seconds). `%f` only has three
+    fractional digits while SQLAlchemy binds datetimes with six, and SQLite
+    compares them as strings, so the value is padded to six digits to compare
+    correctly against bound timestamps.
+    """
+    return func.strftime("%Y-%m-%d %H:%M:%f", "now").concat("000")
+
+
+# Preset dictionaries for compressing serialized messages. zlib can reference
+# them from the first byte, which matters for short messages. Each stored blob
+# starts with the version of the dictionary it was compressed with, so a
+# dictionary must never change once rows use it; add a new version instead.
+_MESSAGE_ZDICT_V1 = (
+    b'"dynamic_ref":null,"part_kind":"system-prompt"},'
+    b'"args":{"args_json":"{\\"'
+    b'"args":{"args_dict":{'
+    b'"part_kind":"retry-prompt"},'
+    b'"part_kind":"tool-return"},'
+    b'"tool_call_id":null,"part_kind":"tool-call"}],'
+    b'"tool_name":"final_result",'
+    b'"part_kind":"text"},'
+    b'"model_name":"gpt-4o","timestamp":"'
+    b'"kind":"response"}'
+    b'{"tool_name":"'
+    b'","tool_call_id":"'
+    b'"part_kind":"user-prompt"}],"kind":"request"}'
+    b'{"parts":[{"content":"'
+    b'","timestamp":"20'
+)
+_MESSAGE_ZDICTS = {1: _MESSAGE_ZDICT_V1}
+_MESSAGE_ZDICT_VERSION = 1
+
+
+class CompressedJSON(TypeDecorator[Any]):
+    """JSON column that is stored zlib-compressed.
+
+    Pre-serialized JSON bytes (such as the output of pydantic's `dump_json`)
+    are compressed as-is, skipping a round-trip through Python objects. Each
+    value is prefixed with the version of the preset dictionary it was
+    compressed with. Rows written before compression was introduced hold JSON
+    text and are still readable.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value: Any, dialect: Any) -> bytes | None:
+        """Serialize (unless already serialized) and compress before storing in DB."""
+        if value is None:
+            return None
+        if not isinstance(value, bytes):
+            value = json.dumps(value, separators=(",", ":")).encode()
+        compressor = zlib.compressobj(zdict=_MESSAGE_ZDICTS[_MESSAGE_ZDICT_VERSION])
+        return (
+            bytes([_MESSAGE_ZDICT_VERSION])
+            + compressor.compress(value)
+            + compressor.flush()
+        )
+
+    def process_result_value(self, value: bytes | str | None, dialect: Any) -> Any:
+        """Decompress and decode JSON when loading from DB."""
+        if value is None:
+            return None
+        if isinstance(value, str):
+            return json.loads(value)
+        version = value[0]
+        if version not in _MESSAGE_ZDICTS:
+            raise ValueError(f"Unknown message compression version: {version}")
+        decompressor = zlib.decompressobj(zdict=_MESSAGE_ZDICTS[version])
+        return json.loads(decompressor.decompress(value[1:]) + decompressor.flush())
+
+
+class UUIDBinary(TypeDecorator[uuid.UUID]):
+    """Custom type for UUIDs that stores them as 16-byte blobs.
+
+    This halves the size of primary keys and the indexes and foreign keys that
+    reference them, compared to storing UUIDs as text.
+    """
+
+    impl = LargeBinary(16)
+    cache_ok = True
+
+    def process_bind_param(self, value: uuid.UUID | None, dialect: Any) -> bytes | None:
+        """Convert UUID to bytes before storing in DB."""
+        if value is None:
+            return None
+        return value.bytes
+
+    def process_result_value(
+        self, value: bytes | str | None, dialect: Any
+    ) -> uuid.UUID | None:
+        """Convert bytes back to UUID when loading from DB.
+
+        Rows written before UUIDs were stored as blobs hold text instead.
+        """
+        if value is None:
+            return None
+        if isinstance(value, str):
+            return uuid.UUID(value)
+        return uuid.UUID(bytes=value)
+
+
 class Base(DeclarativeBase):
     """Base class for all database models."""
 
@@ -132,7 +399,7 @@ class DBThread(Base):
 
     id: Mapped[str] = mapped_column(String, primary_key=True)
     parent_thread_id: Mapped[str | None] = mapped_column(ForeignKey("threads.id"))
-    created_at: Mapped[datetime] = mapped_column(default=utc_now)
+    created_at: Mapped[datetime] = mapped_column(server_default=_server_utc_now())
 
     messages: Mapped[list["DBMessage"]] = relationship(back_populates="thread")
     llm_calls: Mapped[list["DBLLMCall"]] = relationship(back_populates="thread")
@@ -160,21 +427,56 @@ class DBThread(Base):
         )
         session.add(thread)
         await session.commit()
-        await session.refresh(thread)
+        # `created_at` is fetched with RETURNING on insert, so a refresh is only
+        # needed when the session expired it on commit
+        if session.sync_session.expire_on_commit:
+            await session.refresh(thread)
         return thread
 
+    @classmethod
+    async def create_many(
+        cls,
+        session: AsyncSession,
+        parent_thread_ids: list[str | None],
+    ) -> list["DBThread"]:
+        """Create several thread records in a single commit.
+
+        Args:
+            session: Database session to use
+            parent_thread_ids: Parent thread ID (or None) for each thread to create
+
+        Returns:
+            The created DBThread instances, in the same order as `parent_thread_ids`
+        """
+        threads = [
+            cls(id=str(uuid.uuid4()), parent_thread_id=parent_thread_id)
+            for parent_thread_id in parent_thread_ids
+        ]
+        ids = [thread.id for thread in threads]
+        session.add_all(threads)
+        await session.commit()
+        if session.sync_session.expire_on_commit:
+            # Reload every expired thread with one query instead of N refreshes
+            await session.execute(select(cls).where(cls.id.in_(ids)))
+        return threads
+
 
 class DBMessage(Base):
     __tablename__ = "messages"
+    # Conversation history is read by thread in timestamp order
+    __table_args__ = (Index("ix_messages_thread_timestamp", "thread_id", "timestamp"),)
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
-    thread_id: Mapped[str] = mapped_column(ForeignKey("threads.id"), index=True)
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUIDBinary, primary_key=True, default=uuid.uuid4
+    )
+    thread_id: Mapped[str] = mapped_column(ForeignKey("threads.id"))
     llm_call_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUIDBinary,
         ForeignKey("llm_calls.id"),
         default=None,
     )
-    message: Mapped[dict[str, Any]] = mapped_column(JSON)
-    timestamp: Mapped[datetime] = mapped_column(default=utc_now)
+    message: Mapped[dict[str, Any]] = mapped_column(CompressedJSON)
+    timestamp: Mapped[datetime] = mapped_column(server_default=_server_utc_now())
 
     thread: Mapped[DBThread] = relationship(back_populates="messages")
     llm_call: Mapped[Optional["DBLLMCall"]] = relationship(back_populates="messages")
@@ -192,6 +494,40 @@ class DBMessage(Base):
             llm_call_id=llm_call_id,
         )
 
+    @classmethod
+    async def bulk_insert(
+        cls,
+        session: AsyncSession,
+        thread_id: str,
+        messages: list[Message],
+        llm_call_id: uuid.UUID | None = None,
+    ) -> None:
+        """Insert several messages with a single executemany.
+
+        This skips the unit of work and identity map, so no DBMessage objects
+        are created or returned. The caller is responsible for committing.
+
+        Args:
+            session: Database session to use
+            thread_id: ID of the thread the messages belong to
+            messages: Messages to insert, in order
+            llm_call_id: Optional ID of the LLM call that generated the messages
+        """
+        if not messages:
+            return
+        await session.execute(
+            insert(cls),
+            [
+                {
+                    "id": uuid.uuid4(),
+                    "thread_id": thread_id,
+                    "message": _dump_message_json(message),
+                    "llm_call_id": llm_call_id,
+                }
+                for message in messages
+            ],
+        )
+
 
 class UsageType(TypeDecorator[Usage]):
     """Custom type for Usage objects that stores them as JSON in the database."""
@@ -218,11 +554,14 @@ class UsageType(TypeDecorator[Usage]):
 
 class DBLLMCall(Base):
     __tablename__ = "llm_calls"
+    __table_args__ = (Index("ix_llm_calls_thread_timestamp", "thread_id", "timestamp"),)
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
-    thread_id: Mapped[str] = mapped_column(ForeignKey("threads.id"), index=True)
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUIDBinary, primary_key=True, default=uuid.uuid4
+    )
+    thread_id: Mapped[str] = mapped_column(ForeignKey("threads.id"))
     usage: Mapped[Usage] = mapped_column(UsageType)
-    timestamp: Mapped[datetime] = mapped_column(default=utc_now)
+    timestamp: Mapped[datetime] = mapped_column(server_default=_server_utc_now())
 
     messages: Mapped[list[DBMessage]] = relationship(back_populates="llm_call")
     thread: Mapped[DBThread] = relationship(back_populates="llm_calls")
@@ -247,7 +586,7 @@ class DBLLMCall(Base):
         llm_call = cls(thread_id=thread_id, usage=usage)
 
         if session is None:
-            async with get_async_session() as session:
+            async with get_async_write_session() as session:
                 session.add(llm_call)
                 await session.commit()
                 await session.refresh(llm_call)
@@ -259,18 +598,77 @@ class DBLLMCall(Base):
             return llm_call
 
 
+async def get_thread_with_messages(
+    session: AsyncSession, thread_id: str
+) -> DBThread | None:
+    """Load a thread with its messages and their LLM calls eagerly loaded.
+
+    Each relationship is loaded with one additional SELECT ... IN query rather
+    than one query per message.
+
+    Args:
+        session: Database session to use
+        thread_id: ID of the thread to load
+
+    Returns:
+        The DBThread instance, or None if it does not exist
+    """
+    result = await session.execute(
+        select(DBThread)
+        .where(DBThread.id == thread_id)
+        .options(selectinload(DBThread.messages).selectinload(DBMessage.llm_call))
+    )
+    return result.scalar_one_or_none()
+
+
+def _check_timestamp_defaults(conn: Connection) -> None:
+    """Fail clearly if the tables predate database-side timestamp defaults.
+
+    Older versions of Marvin set timestamps client-side and created the
+    columns without a default. Every insert into such a table would fail with
+    a NOT NULL constraint error.
+    """
+    for table in Base.metadata.sorted_tables:
+        for column in table.columns:
+            if column.server_default is None:
+                continue
+            columns = conn.exec_driver_sql(f'PRAGMA table_info("{table.name}")')
+            # rows are (cid, name, type, notnull, dflt_value, pk)
+            if any(row[1] == column.name and row[4] is None for row in columns):
+                raise RuntimeError(
+                    f"The database at {settings.database_url} was created by an"
+                    " older version of Marvin and can't be written to by this"
+                    " one. Delete it or set MARVIN_DATABASE_URL to a new path to"
+                    " recreate it; this erases stored threads."
+                )
+
+
 def ensure_tables_exist():
     """Initialize database tables if they don't exist yet.
 
-    For in-memory databases, tables are always created since each connection
-    starts with a fresh database. For file-based databases, tables are only
-    created if they don't exist.
+    Tables that already exist are left alone, and any that are missing are
+    created. File-based databases are also switched to WAL mode, which lets
+    readers proceed while a write is in progress and persists in the file.
     """
     engine = get_engine()
     is_memory_db = settings.database_url == ":memory:"
 
-    if is_memory_db or not inspect(engine).get_table_names():
-        Base.metadata.create_all(engine)
+    if not is_memory_db:
+        # journal_mode can't be changed inside a transaction, so bypass the
+        # `begin` listener
+        dbapi_connection = engine.raw_connection()
+        try:
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.close()
+        finally:
+            dbapi_connection.close()
+
+    with engine.begin() as conn:
+        Base.metadata.create_all(conn, checkfirst=True)
+        _check_timestamp_defaults(conn)
+        if not is_memory_db:
+            conn.exec_driver_sql("PRAGMA optimize")
 
 
 @contextmanager
@@ -283,10 +681,48 @@ def get_session() -> Generator[Session, None, None]:
         session.close()
 
 
+@contextmanager
+def get_write_session() -> Generator[Session, None, None]:
+    """Get a database session whose transactions begin with `BEGIN IMMEDIATE`."""
+    session = Session(get_engine().execution_options(**{_BEGIN_IMMEDIATE: True}))
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@asynccontextmanager
+async def get_async_session(
+    expire_on_commit: bool = True,
+) -> AsyncGenerator[AsyncSession, None]:
+    """Get an async database session.
+
+    Args:
+        expire_on_commit: Whether to expire objects on commit. Pass False to
+            keep using objects after commit without another round-trip, as
+            long as none of their attributes differ from their stored form.
+    """
+    session = AsyncSession(get_async_engine(), expire_on_commit=expire_on_commit)
+    try:
+        yield session
+    finally:
+        await session.close()
+
+
 @asynccontextmanager
-async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
-    """Get an async database session."""
-    session = AsyncSession(get_async_engine())
+async def get_async_write_session(
+    expire_on_commit: bool = True,
+) -> AsyncGenerator[AsyncSession, None]:
+    """Get an async database session whose transactions begin with `BEGIN IMMEDIATE`.
+
+    Args:
+        expire_on_commit: Whether to expire objects on commit, as for
+            `get_async_session`
+    """
+    session = AsyncSession(
+        get_async_engine().execution_options(**{_BEGIN_IMMEDIATE: True}),
+        expire_on_commit=expire_on_commit,
+    )
     try:
         yield session
     finally:
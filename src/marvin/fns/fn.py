@@ -1,9 +1,9 @@
 import inspect
 import json
 from collections.abc import Callable
-from dataclasses import asdict
+from dataclasses import asdict, dataclass
 from functools import wraps
-from typing import Any, ParamSpec, TypeVar
+from typing import Any, Generic, ParamSpec, TypeVar
 
 import marvin
 from marvin.agents.agent import Agent
@@ -30,8 +30,43 @@ When returning a string, do not add unecessary quotes.
 """
 
 
+@dataclass
+class _TaskTemplate(Generic[P, T]):
+    """The parts of a prediction task that are the same for every call."""
+
+    function: PythonFunction[P, T]
+    name: str
+    result_type: Any
+    parse_json: bool
+    # the function definition, except for the docstring, which is rendered per call
+    definition: dict[str, Any]
+
+    @classmethod
+    def from_function(cls, func: Callable[P, T]) -> "_TaskTemplate[P, T]":
+        """Create a template from the function being predicted."""
+        python_function = PythonFunction[P, T].from_function(func)
+
+        # Get the return annotation, defaulting to str if not specified
+        result_type = python_function.return_annotation
+        parse_json = result_type is inspect.Signature.empty
+        if parse_json:
+            result_type = str
+
+        return cls(
+            function=python_function,
+            name=f"Predict output of {python_function.name}",
+            result_type=result_type,
+            parse_json=parse_json,
+            definition={
+                "signature": str(python_function.signature),
+                "name": python_function.name,
+                "parameters": [asdict(p) for p in python_function.parameters],
+            },
+        )
+
+
 def _build_task(
-    func: Callable[P, T],
+    template: _TaskTemplate[P, T],
     fn_args: tuple[Any, ...],
     fn_kwargs: dict[str, Any],
     instructions: str | None = None,
@@ -40,7 +75,7 @@ def _build_task(
     """Build a Task for predicting the output of a Python function.
 
     Args:
-        func: The function to predict output for
+        template: The precomputed task template for the function
         fn_args: Positional arguments that would be passed to the function
         fn_kwargs: Keyword arguments that would be passed to the function
         instructions: Optional instructions to guide the prediction
@@ -49,44 +84,30 @@ def _build_task(
     Returns:
         A Task configured to predict the function's output
     """
-    context: dict[str, Any] = {}
+    assert template.result_type is not None, "No return annotation found"
 
-    model = PythonFunction[P, T].from_function_call(func, *fn_args, **fn_kwargs)
+    model = template.function.bind_call(*fn_args, **fn_kwargs)
 
-    # Get the return annotation, defaulting to str if not specified
-    original_return_annotation = model.return_annotation
-    if original_return_annotation is inspect.Signature.empty:
-        model.return_annotation = str
+    context: dict[str, Any] = {}
+    if template.parse_json:
         context["JSON result"] = (
             "If possible, your answer will be parsed by json.loads()"
         )
-
-    # exclude bound_parameters, function, source_code, return_value
-    model_context = {
-        "signature": str(model.signature),
-        "name": model.name,
-        "parameters": [asdict(p) for p in model.parameters],
+    context["Function definition"] = {
+        **template.definition,
         "docstring": model.docstring,
-        "return_annotation": model.return_annotation,
+        "return_annotation": template.result_type,
     }
-
-    context.update(
-        {
-            "Function definition": model_context,
-            "Function arguments": model.bound_parameters,
-            "Additional context": model.return_value,
-        }
-    )
+    context["Function arguments"] = model.bound_parameters
+    context["Additional context"] = model.return_value
     if instructions:
         context["Additional instructions"] = instructions
 
-    assert model.return_annotation is not None, "No return annotation found"
-
     return marvin.Task[T](
-        name=f"Predict output of {func.__name__}",
+        name=template.name,
         instructions=PROMPT,
         context=context,
-        result_type=model.return_annotation,
+        result_type=template.result_type,
         agents=[agent] if agent else None,
     )
 
@@ -130,6 +151,8 @@ def fn(
 
     def decorator(f: Callable[P, T]) -> Callable[P, T]:
         is_coroutine_fn = inspect.iscoroutinefunction(f)
+        # the signature, parameters, and source don't change between calls
+        template = _TaskTemplate[P, T].from_function(f)
 
         @wraps(f)
         def wrapper(
@@ -139,17 +162,15 @@ def fn(
             _instructions: str | None = None,
             **kwargs: Any,
         ) -> T:
-            coro = _fn(
-                f,
+            run = _build_and_run_async if is_coroutine_fn else _build_and_run_sync
+            return run(  # type: ignore[return-value]
+                template,
                 args,
                 kwargs,
                 instructions=_instructions or instructions,
                 agent=_agent or agent,
                 thread=_thread or thread,
             )
-            if is_coroutine_fn:
-                return coro  # type: ignore[return-value]
-            return run_sync(coro)
 
         def as_task(
             *args: Any,
@@ -159,7 +180,7 @@ def fn(
         ) -> marvin.Task[T]:
             """Return a Task configured to predict this function's output."""
             return _build_task(
-                f,
+                template,
                 args,
                 kwargs,
                 instructions=_instructions or instructions,
@@ -174,8 +195,39 @@ def fn(
     return decorator(func)
 
 
-async def _fn(
-    func: Callable[P, T],
+def _parse_result(template: _TaskTemplate[P, T], result: Any) -> T:
+    """Parse the result as JSON if the function has no return annotation."""
+    if template.parse_json:
+        try:
+            result = json.loads(result)
+        except Exception:
+            logger.debug("Failed to parse result as JSON, returning raw result")
+
+    return result
+
+
+def _build_and_run_sync(
+    template: _TaskTemplate[P, T],
+    fn_args: tuple[Any, ...],
+    fn_kwargs: dict[str, Any],
+    instructions: str | None = None,
+    agent: Agent | None = None,
+    thread: Thread | str | None = None,
+) -> T:
+    """Synchronous version of `_build_and_run_async`.
+
+    The task is built in the caller's frame; only running it goes through the
+    event loop.
+    """
+    task = _build_task(
+        template, fn_args, fn_kwargs, instructions=instructions, agent=agent
+    )
+    result = run_sync(task.run_async(thread=thread, handlers=[]))
+    return _parse_result(template, result)
+
+
+async def _build_and_run_async(
+    template: _TaskTemplate[P, T],
     fn_args: tuple[Any, ...],
     fn_kwargs: dict[str, Any],
     instructions: str | None = None,
@@ -185,7 +237,7 @@ async def _fn(
     """Predicts the output of a Python function without executing it.
 
     Args:
-        func: The function to predict output for
+        template: The precomputed task template for the function
         fn_args: Positional arguments that would be passed to the function
         fn_kwargs: Keyword arguments that would be passed to the function
         instructions: Optional instructions to guide the prediction
@@ -196,13 +248,8 @@ async def _fn(
         The predicted output matching the function's return type
 
     """
-    task = _build_task(func, fn_args, fn_kwargs, instructions=instructions, agent=agent)
+    task = _build_task(
+        template, fn_args, fn_kwargs, instructions=instructions, agent=agent
+    )
     result = await task.run_async(thread=thread, handlers=[])
-
-    if "JSON result" in task.context:
-        try:
-            result = json.loads(result)  # type: ignore
-        except Exception:
-            logger.debug("Failed to parse result as JSON, returning raw result")
-
-    return result
+    return _parse_result(template, result)
@@ -3,10 +3,11 @@
 from pathlib import Path
 from typing import Literal
 
-from pydantic import Field, ValidationInfo, field_validator, model_validator
+from pydantic import Field, ValidationInfo, field_validator
 from pydantic_ai.models import KnownModelName
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing_extensions import Self
+
+import marvin.utilities.logging
 
 
 class Settings(BaseSettings):
@@ -72,6 +73,8 @@ class Settings(BaseSettings):
     log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = Field(
         default="INFO",
         description="Logging level",
+        # validate the default too, so logging is set up for every instance
+        validate_default=True,
     )
 
     log_events: bool = Field(
@@ -85,14 +88,17 @@ class Settings(BaseSettings):
         """Validate the log level."""
         return v.upper()
 
-    @model_validator(mode="after")
-    def setup_logging(self) -> Self:
-        """Finalize the settings."""
-        import marvin.utilities.logging
+    @field_validator("log_level")
+    @classmethod
+    def setup_logging(cls, v: str) -> str:
+        """Configure logging for the log level.
 
-        marvin.utilities.logging.setup_logging(self.log_level)
+        This is a field validator rather than a model validator so that
+        assigning other settings doesn't rebuild the log handlers.
+        """
+        marvin.utilities.logging.setup_logging(v)
 
-        return self
+        return v
 
     # ------------ Agent settings ------------
 
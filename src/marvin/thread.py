@@ -11,9 +11,15 @@ from typing import Any, Optional
 
 from pydantic import TypeAdapter
 from pydantic_ai.usage import Usage
-from sqlalchemy import select
-
-from marvin.database import DBLLMCall, DBMessage, DBThread, get_async_session
+from sqlalchemy import literal_column, select
+
+from marvin.database import (
+    DBLLMCall,
+    DBMessage,
+    DBThread,
+    get_async_session,
+    get_async_write_session,
+)
 from marvin.utilities.asyncio import run_sync
 
 from .engine.llm import Message, UserMessage
@@ -68,7 +74,9 @@ class Thread:
         if self._db_thread is not None:
             return
 
-        async with get_async_session() as session:
+        # The thread is kept after the session closes. Its columns are all set
+        # client-side or returned on insert, so it doesn't need a refresh.
+        async with get_async_write_session(expire_on_commit=False) as session:
             self._db_thread = await session.get(DBThread, self.id)
             if not self._db_thread:
                 self._db_thread = await DBThread.create(
@@ -101,14 +109,13 @@ class Thread:
         """
         await self._ensure_thread_exists()
 
-        async with get_async_session() as session:
-            for message in messages:
-                db_message = DBMessage.from_message(
-                    thread_id=self.id,
-                    message=message,
-                    llm_call_id=llm_call_id,
-                )
-                session.add(db_message)
+        async with get_async_write_session() as session:
+            await DBMessage.bulk_insert(
+                session,
+                thread_id=self.id,
+                messages=messages,
+                llm_call_id=llm_call_id,
+            )
             await session.commit()
 
     def add_user_message(self, message: str):
@@ -177,7 +184,11 @@ class Thread:
             if after is not None:
                 query = query.where(DBMessage.timestamp > after)
 
-            query = query.order_by(DBMessage.timestamp)
+            # Messages added together share a timestamp; rowid keeps them in
+            # insertion order
+            query = query.order_by(
+                DBMessage.timestamp, literal_column("messages.rowid")
+            )
 
             if limit is not None:
                 query = query.limit(limit)
@@ -214,7 +225,9 @@ class Thread:
             if after is not None:
                 query = query.where(DBLLMCall.timestamp > after)
 
-            query = query.order_by(DBLLMCall.timestamp)
+            query = query.order_by(
+                DBLLMCall.timestamp, literal_column("llm_calls.rowid")
+            )
 
             if limit is not None:
                 query = query.limit(limit)
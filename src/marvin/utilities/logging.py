@@ -51,15 +51,24 @@ def get_logger(name: str | None = None) -> logging.Logger:
     return logger
 
 
+# The level logging was last set up with, so setting up the same level again
+# doesn't rebuild the handlers
+_applied_log_level: str | None = None
+
+
 def setup_logging(
     level: str | None = None,
 ) -> None:
+    global _applied_log_level
     logger = get_logger()
 
-    if level is not None:
-        logger.setLevel(level)
-    else:
-        logger.setLevel(marvin.settings.log_level)
+    if level is None:
+        level = marvin.settings.log_level
+    if level == _applied_log_level:
+        return
+
+    logger.setLevel(level)
+    _applied_log_level = level
 
     logger.handlers.clear()
 
@@ -1,8 +1,10 @@
+import copy
 import inspect
+import types
 from collections.abc import Callable
 from dataclasses import dataclass
-from functools import wraps
-from typing import Any, Literal, TypeVar, overload
+from functools import update_wrapper, wraps
+from typing import Any, Literal, NoReturn, TypeVar, overload
 
 import pydantic_ai
 from pydantic_ai import RunContext
@@ -78,6 +80,19 @@ def update_fn(
     """
 
     def apply(func: Callable[..., T], new_name: str) -> Callable[..., T]:
+        # Copy plain functions and methods rather than wrapping them, so that
+        # calls don't go through an extra frame
+        if isinstance(func, types.FunctionType):
+            return _copy_function(func, new_name, description)
+        if isinstance(func, types.MethodType) and isinstance(
+            func.__func__, types.FunctionType
+        ):
+            return types.MethodType(
+                _copy_function(func.__func__, new_name, description),
+                func.__self__,
+            )
+
+        # Other callables (builtins, partials, callable objects) get a wrapper
         if inspect.iscoroutinefunction(func):
 
             @wraps(func)
@@ -110,6 +125,30 @@ def update_fn(
     return decorator
 
 
+def _copy_function(
+    func: types.FunctionType, name: str, description: str | None
+) -> types.FunctionType:
+    """Copy a function with a new name and, optionally, a new docstring.
+
+    The copy shares the original's code, globals, and closure, so the original
+    function is left untouched.
+    """
+    new_func = types.FunctionType(
+        func.__code__,
+        func.__globals__,
+        name,
+        func.__defaults__,
+        func.__closure__,
+    )
+    update_wrapper(new_func, func)
+    new_func.__name__ = name
+    new_func.__kwdefaults__ = copy.copy(func.__kwdefaults__)
+    new_func.__annotations__ = dict(func.__annotations__)
+    if description is not None:
+        new_func.__doc__ = description
+    return new_func
+
+
 @dataclass
 class ResultTool:
     type: Literal["result-tool"] = "result-tool"
@@ -118,6 +157,14 @@ class ResultTool:
         pass
 
 
+def _raise_as_model_retry(e: Exception) -> NoReturn:
+    """Re-raise a tool error as a ModelRetry so the model can try again."""
+    logger.debug("Tool failed: %s", e)
+    if isinstance(e, pydantic_ai.ModelRetry):
+        raise e
+    raise pydantic_ai.ModelRetry(message=f"Tool failed: {e}") from e
+
+
 def wrap_tool_errors(tool_fn: Callable[..., Any]):
     """
     Pydantic AI doesn't catch errors except for ModelRetry, so we need to make
@@ -129,12 +176,8 @@ def wrap_tool_errors(tool_fn: Callable[..., Any]):
         async def _fn(*args, **kwargs):
             try:
                 return await tool_fn(*args, **kwargs)
-            except pydantic_ai.ModelRetry as e:
-                logger.debug(f"Tool failed: {e}")
-                raise e
             except Exception as e:
-                logger.debug(f"Tool failed: {e}")
-                raise pydantic_ai.ModelRetry(message=f"Tool failed: {e}") from e
+                _raise_as_model_retry(e)
 
         return _fn
 
@@ -144,11 +187,7 @@ def wrap_tool_errors(tool_fn: Callable[..., Any]):
         def _fn(*args: Any, **kwargs: Any):
             try:
                 return tool_fn(*args, **kwargs)
-            except pydantic_ai.ModelRetry as e:
-                logger.debug(f"Tool failed: {e}")
-                raise e
             except Exception as e:
-                logger.debug(f"Tool failed: {e}")
-                raise pydantic_ai.ModelRetry(message=f"Tool failed: {e}") from e
+                _raise_as_model_retry(e)
 
         return _fn
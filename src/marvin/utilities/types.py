@@ -2,7 +2,7 @@ import enum
 import inspect
 import textwrap
 from collections.abc import Callable, Sequence
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import (
     TYPE_CHECKING,
     Annotated,
@@ -16,6 +16,8 @@ from typing import (
     get_origin,
 )
 
+from jinja2 import Template
+
 from marvin.utilities.asyncio import run_sync
 from marvin.utilities.jinja import jinja_env
 
@@ -291,6 +293,7 @@ class PythonFunction(Generic[P, R]):
         source_code (str): The source code of the function.
         bound_parameters (dict[str, Any]): The parameters of the function bound with values.
         return_value (Optional[Any]): The return value of the function call.
+        docstring_template (Optional[Template]): The function's docstring compiled as a jinja template.
 
     """
 
@@ -303,6 +306,7 @@ class PythonFunction(Generic[P, R]):
     source_code: str | None = None
     bound_parameters: dict[str, Any] = field(default_factory=dict)
     return_value: Any | None = None
+    docstring_template: Template | None = field(default=None, repr=False, compare=False)
 
     @property
     def definition(self) -> str:
@@ -364,6 +368,8 @@ class PythonFunction(Generic[P, R]):
             "parameters": parameters,
             "return_annotation": sig.return_annotation,
             "source_code": source_code,
+            # compiled once here, since the docstring is rendered on every call
+            "docstring_template": jinja_env.from_string(func.__doc__ or ""),
         }
 
         function_dict.update(kwargs)
@@ -388,25 +394,38 @@ class PythonFunction(Generic[P, R]):
             PythonFunction: The created PythonFunction instance, with the return value of the function call set as an attribute.
 
         """
-        sig = inspect.signature(func)
+        return cls.from_function(func).bind_call(*args, **kwargs)
+
+    def bind_call(self, *args: P.args, **kwargs: P.kwargs) -> "PythonFunction[P, R]":
+        """Create a copy of this PythonFunction for a call with the given arguments.
+
+        Only the call-specific attributes are computed, so an instance created
+        once with `from_function` can be reused across calls.
+
+        Args:
+            *args: Positional arguments to pass to the function call.
+            **kwargs: Keyword arguments to pass to the function call.
+
+        Returns:
+            PythonFunction: A copy with the bound parameters, rendered docstring, and return value of the function call set.
 
-        bound = sig.bind(*args, **kwargs)
+        """
+        bound = self.signature.bind(*args, **kwargs)
         bound.apply_defaults()
 
-        return_value = func(*bound.args, **bound.kwargs)
+        return_value = self.function(*bound.args, **bound.kwargs)
         if inspect.iscoroutine(return_value):
             return_value = run_sync(return_value)
 
         # render the docstring with the bound arguments, if it was supplied as jinja
-        docstring = jinja_env.from_string(func.__doc__ or "").render(
-            **dict(bound.arguments.items()),
+        template = self.docstring_template or jinja_env.from_string(
+            self.function.__doc__ or ""
         )
+        docstring = template.render(**dict(bound.arguments.items()))
 
-        instance = cls.from_function(
-            func,
-            docstring=docstring,
+        return replace(
+            self,
+            docstring=inspect.cleandoc(docstring) if docstring else None,
             bound_parameters={k: v for k, v in bound.arguments.items()},
             return_value=return_value,
         )
-
-        return instance
@@ -4,12 +4,14 @@ import pytest
 from marvin.defaults import override_defaults
 
 
-@pytest.fixture(autouse=True)
+# Package-scoped so the override ends when the run leaves tests/basic
+@pytest.fixture(autouse=True, scope="package")
 def prevent_model_requests():
     with pydantic_ai.models.override_allow_model_requests(False):
         yield
 
 
+# Function-scoped because tests customize the model's results
 @pytest.fixture(autouse=True)
 def test_model():
     model = pydantic_ai.models.test.TestModel()
@@ -1,10 +1,23 @@
-from sqlalchemy import select
+import asyncio
+import sqlite3
+import uuid
+from datetime import timedelta
+
+import pytest
+from pydantic_ai.messages import ModelRequest, UserPromptPart
+from pydantic_ai.usage import Usage
+from sqlalchemy import create_engine, event, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from marvin import database
 from marvin.database import (
+    DBLLMCall,
     DBMessage,
     DBThread,
     create_db_and_tables,
+    get_thread_with_messages,
+    message_adapter,
 )
 
 
@@ -110,3 +123,328 @@ async def test_relationship_operations(session):
 
     result = await session.execute(select(DBThread).where(DBThread.id == "test-thread"))
     assert result.scalars().first() is None
+
+
+def test_engine_override_and_reset():
+    """Test that set engines take precedence until engines are reset."""
+    database.reset_engines()
+    built = database.get_engine()
+    assert database.get_engine() is built
+
+    override = create_engine("sqlite://")
+    database.set_engine(override)
+    assert database.get_engine() is override
+
+    database.reset_engines()
+    rebuilt = database.get_engine()
+    assert rebuilt is not built
+    assert rebuilt is not override
+
+    for engine in (built, override, rebuilt):
+        engine.dispose()
+
+
+def test_file_engine_uses_wal():
+    """Test that file-based databases use WAL and connections are configured."""
+    database.reset_engines()
+    engine = database.get_engine()
+    try:
+        database.ensure_tables_exist()
+        with engine.connect() as conn:
+            mmap_size = conn.exec_driver_sql("PRAGMA mmap_size").scalar()
+        assert mmap_size == 268435456
+
+        # WAL is stored in the file, so a connection configured elsewhere sees it
+        other = sqlite3.connect(database.settings.database_url)
+        try:
+            assert other.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+        finally:
+            other.close()
+    finally:
+        engine.dispose()
+
+
+@pytest.mark.parametrize("write", [True, False])
+def test_write_session_begins_immediate(write):
+    """Test that write sessions take the write lock when they begin."""
+    database.reset_engines()
+    get_session = database.get_write_session if write else database.get_session
+    try:
+        with get_session() as session:
+            session.execute(select(DBThread)).all()
+
+            other = sqlite3.connect(database.settings.database_url, timeout=0)
+            try:
+                if write:
+                    with pytest.raises(sqlite3.OperationalError, match="locked"):
+                        other.execute("BEGIN IMMEDIATE")
+                else:
+                    other.execute("BEGIN IMMEDIATE")
+                    other.rollback()
+            finally:
+                other.close()
+    finally:
+        database.get_engine().dispose()
+
+
+async def test_periodic_optimize_task(monkeypatch):
+    """Test that the async engine runs PRAGMA optimize until it is replaced."""
+    database.reset_engines()
+    monkeypatch.setattr(database, "_optimize_task", None)
+    monkeypatch.setattr(database, "OPTIMIZE_INTERVAL_SECONDS", 0.01)
+    engine = database.get_async_engine()
+    task = database._optimize_task
+    assert task is not None
+
+    # The task is started when the engine is built, not on every lookup
+    monkeypatch.setattr(database, "_start_optimize_task", None)
+    assert database.get_async_engine() is engine
+
+    statements = []
+    event.listen(
+        engine.sync_engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    await asyncio.sleep(0.1)
+    assert "PRAGMA optimize" in statements
+    assert not task.done()
+
+    # Installing an engine stops the task after its current iteration
+    database.set_async_engine(engine)
+    await asyncio.wait_for(task, timeout=1)
+    await engine.dispose()
+
+
+@pytest.mark.parametrize("expire_on_commit", [True, False])
+async def test_create_many_threads(expire_on_commit):
+    """Test that threads created in a batch are usable after commit."""
+    async with AsyncSession(
+        database.get_async_engine(), expire_on_commit=expire_on_commit
+    ) as session:
+        parent_id = (await DBThread.create(session)).id
+        threads = await DBThread.create_many(session, [None, parent_id])
+
+        assert len(threads) == 2
+        assert threads[0].parent_thread_id is None
+        assert threads[1].parent_thread_id == parent_id
+        assert threads[0].created_at is not None
+
+        result = await session.execute(select(DBThread))
+        assert len(result.scalars().all()) == 3
+
+
+async def test_get_thread_with_messages(session):
+    """Test that messages and their LLM calls are loaded eagerly."""
+    thread = await DBThread.create(session, id="test-thread")
+    llm_call = await DBLLMCall.create(thread_id=thread.id, usage=Usage())
+    session.add_all(
+        [
+            DBMessage(
+                thread_id=thread.id,
+                message={"role": "user", "content": "test1", "kind": "request"},
+            ),
+            DBMessage(
+                thread_id=thread.id,
+                message={"role": "assistant", "content": "test2", "kind": "response"},
+                llm_call_id=llm_call.id,
+            ),
+        ]
+    )
+    await session.commit()
+
+    async with database.get_async_session() as new_session:
+        loaded = await get_thread_with_messages(new_session, "test-thread")
+
+    # The session is closed, so any lazy load here would raise
+    assert loaded is not None
+    assert [m.message["content"] for m in loaded.messages] == ["test1", "test2"]
+    assert loaded.messages[0].llm_call is None
+    assert loaded.messages[1].llm_call.id == llm_call.id
+
+
+async def test_get_missing_thread_with_messages(session):
+    assert await get_thread_with_messages(session, "missing") is None
+
+
+async def test_uuids_stored_as_blobs(session, session_sync):
+    """Test that UUID primary and foreign keys are stored as 16-byte blobs."""
+    thread = await DBThread.create(session, id="test-thread")
+    llm_call = await DBLLMCall.create(thread_id=thread.id, usage=Usage())
+    session.add(
+        DBMessage(
+            thread_id=thread.id,
+            message={"role": "user", "content": "test", "kind": "request"},
+            llm_call_id=llm_call.id,
+        )
+    )
+    await session.commit()
+
+    row = session_sync.execute(
+        text(
+            "SELECT typeof(id), length(id), typeof(llm_call_id), length(llm_call_id)"
+            " FROM messages"
+        )
+    ).one()
+    assert tuple(row) == ("blob", 16, "blob", 16)
+
+    result = await session.execute(select(DBMessage))
+    assert result.scalar_one().llm_call_id == llm_call.id
+
+
+@pytest.mark.parametrize("expire_on_commit", [True, False])
+async def test_messages_stored_compressed(session_sync, expire_on_commit):
+    """Test that messages are stored compressed and read back as JSON."""
+    async with database.get_async_session(expire_on_commit) as session:
+        thread = await DBThread.create(session, id="test-thread")
+        message = ModelRequest(parts=[UserPromptPart(content="hello " * 100)])
+        db_message = DBMessage.from_message(thread_id=thread.id, message=message)
+        session.add(db_message)
+        await session.commit()
+
+        # The added object is still in the session, so the query returns it
+        result = await session.execute(select(DBMessage))
+        loaded = result.scalar_one()
+
+    stored = session_sync.execute(text("SELECT message FROM messages")).scalar_one()
+    assert isinstance(stored, bytes)
+    assert len(stored) < len(message_adapter.dump_json(message))
+
+    assert loaded is db_message
+    assert isinstance(loaded.message, dict)
+    assert message_adapter.validate_python(loaded.message) == message
+
+
+async def test_uncompressed_messages_still_readable(session, session_sync):
+    """Test that messages stored as plain JSON text can still be read."""
+    await DBThread.create(session, id="test-thread")
+    session_sync.execute(
+        text(
+            "INSERT INTO messages (id, thread_id, message, timestamp)"
+            " VALUES (:id, 'test-thread', :message, CURRENT_TIMESTAMP)"
+        ),
+        {"id": uuid.uuid4().bytes, "message": '{"kind": "request", "parts": []}'},
+    )
+    session_sync.commit()
+
+    result = await session.execute(select(DBMessage))
+    assert result.scalar_one().message == {"kind": "request", "parts": []}
+
+
+async def test_timestamps_set_by_database(session):
+    """Test that timestamps are filled in by SQLite in UTC and loaded on insert."""
+    before = database.utc_now().replace(tzinfo=None)
+    thread = await DBThread.create(session, id="test-thread")
+    llm_call = await DBLLMCall.create(thread_id=thread.id, usage=Usage())
+    after = database.utc_now().replace(tzinfo=None)
+
+    for timestamp in (thread.created_at, llm_call.timestamp):
+        # SQLite keeps milliseconds, so allow for truncation
+        assert before - timedelta(milliseconds=1) <= timestamp <= after
+
+
+async def test_bulk_insert_messages(session):
+    """Test that messages inserted in bulk are stored in order."""
+    thread = await DBThread.create(session, id="test-thread")
+    llm_call = await DBLLMCall.create(thread_id=thread.id, usage=Usage())
+    messages = [
+        ModelRequest(parts=[UserPromptPart(content=f"message {i}")]) for i in range(3)
+    ]
+    await DBMessage.bulk_insert(session, thread.id, messages, llm_call_id=llm_call.id)
+    await DBMessage.bulk_insert(session, thread.id, [])
+    await session.commit()
+
+    async with database.get_async_session() as new_session:
+        loaded = await get_thread_with_messages(new_session, "test-thread")
+
+    assert loaded is not None
+    assert [message_adapter.validate_python(m.message) for m in loaded.messages] == (
+        messages
+    )
+    assert all(m.llm_call_id == llm_call.id for m in loaded.messages)
+    assert len({m.id for m in loaded.messages}) == 3
+
+
+def test_thread_history_reads_use_index(session_sync):
+    """Test that reading a thread's history in order doesn't need a sort."""
+    for table in ("messages", "llm_calls"):
+        plan = session_sync.execute(
+            text(
+                f"EXPLAIN QUERY PLAN SELECT * FROM {table} WHERE thread_id = 'x'"
+                f" ORDER BY timestamp, {table}.rowid"
+            )
+        ).all()
+        details = " ".join(row[-1] for row in plan)
+        assert f"ix_{table}_thread_timestamp" in details
+        assert "TEMP B-TREE" not in details
+
+
+def test_ensure_tables_exist_creates_missing_tables(session_sync):
+    """Test that missing tables are created even if others already exist."""
+    DBLLMCall.__table__.drop(session_sync.get_bind())
+    session_sync.commit()
+
+    database.ensure_tables_exist()
+
+    result = session_sync.execute(
+        text("SELECT name FROM sqlite_master WHERE type = 'table'")
+    )
+    assert {"threads", "messages", "llm_calls"} <= set(result.scalars())
+
+
+def test_compressed_json_version_header(monkeypatch):
+    """Test that compressed values record and honor their dictionary version."""
+    column = database.CompressedJSON()
+    value = {"kind": "request", "parts": []}
+
+    stored = column.process_bind_param(value, None)
+    assert stored[0] == database._MESSAGE_ZDICT_VERSION
+    assert column.process_result_value(stored, None) == value
+
+    # Values written with an older dictionary stay readable after a new one is added
+    monkeypatch.setitem(database._MESSAGE_ZDICTS, 2, b'{"kind":"request"}')
+    monkeypatch.setattr(database, "_MESSAGE_ZDICT_VERSION", 2)
+    newer = column.process_bind_param(value, None)
+    assert newer[0] == 2
+    assert column.process_result_value(newer, None) == value
+    assert column.process_result_value(stored, None) == value
+
+    with pytest.raises(ValueError, match="Unknown message compression version"):
+        column.process_result_value(b"\x07" + stored[1:], None)
+
+
+def test_ensure_tables_exist_rejects_old_schema(tmp_path, monkeypatch):
+    """Test that tables without timestamp defaults fail with a clear error."""
+    path = tmp_path / "old.db"
+    old = sqlite3.connect(path)
+    old.executescript(
+        """
+        CREATE TABLE threads (
+            id VARCHAR NOT NULL PRIMARY KEY,
+            parent_thread_id VARCHAR REFERENCES threads (id),
+            created_at DATETIME NOT NULL
+        );
+        """
+    )
+    old.close()
+
+    monkeypatch.setattr(database.settings, "database_url", str(path))
+    database.reset_engines()
+    try:
+        with pytest.raises(RuntimeError, match="older version of Marvin"):
+            database.ensure_tables_exist()
+    finally:
+        database.get_engine().dispose()
+        database.reset_engines()
+
+
+def test_compressed_json_dicts_match_serialized_bytes():
+    """Test that dicts are encoded as compactly as pre-serialized JSON."""
+    column = database.CompressedJSON()
+    message = ModelRequest(parts=[UserPromptPart(content="hello")])
+
+    from_bytes = column.process_bind_param(message_adapter.dump_json(message), None)
+    from_dict = column.process_bind_param(
+        message_adapter.dump_python(message, mode="json"), None
+    )
+    assert from_dict == from_bytes
@@ -1,7 +1,10 @@
 """Tests for thread functionality and message handling."""
 
 from pydantic_ai.messages import ModelRequest, ModelResponse, UserPromptPart
+from pydantic_ai.usage import Usage
+from sqlalchemy import select
 
+from marvin.database import DBLLMCall, DBMessage
 from marvin.engine.llm import AgentMessage, SystemMessage, UserMessage
 from marvin.thread import Thread
 
@@ -76,3 +79,20 @@ def test_thread_messages():
 
     assert len(messages) == 1
     assert messages[0].parts[0].content == "Hello"
+
+
+async def test_timestamp_filters_exclude_boundary(session):
+    """Test that before/after a row's own timestamp excludes that row."""
+    thread = Thread()
+    await thread.add_user_message_async("Hello")
+    await DBLLMCall.create(thread_id=thread.id, usage=Usage())
+
+    result = await session.execute(select(DBMessage.timestamp))
+    message_timestamp = result.scalar_one()
+    result = await session.execute(select(DBLLMCall.timestamp))
+    call_timestamp = result.scalar_one()
+
+    assert await thread.get_messages_async(before=message_timestamp) == []
+    assert await thread.get_messages_async(after=message_timestamp) == []
+    assert await thread.get_llm_calls_async(before=call_timestamp) == []
+    assert await thread.get_llm_calls_async(after=call_timestamp) == []
@@ -0,0 +1,84 @@
+import inspect
+
+import pytest
+
+import marvin
+
+
+@marvin.fn
+def list_fruit(n: int, color: str = "red") -> list[str]:
+    """Returns a list of `n` {{ color }} fruit"""
+
+
+@marvin.fn
+async def list_fruit_async(n: int) -> list[str]:
+    """Returns a list of `n` fruit"""
+
+
+@marvin.fn
+def describe(x):
+    """Describes x"""
+    return "x is a number"
+
+
+class TestAsTask:
+    def test_task_context(self):
+        task = list_fruit.as_task(3)
+        assert task.name == "Predict output of list_fruit"
+        assert task.result_type == list[str]
+        assert task.context == {
+            "Function definition": {
+                "signature": "(n: int, color: str = 'red') -> list[str]",
+                "name": "list_fruit",
+                "parameters": [
+                    {"name": "n", "annotation": "<class 'int'>", "default": None},
+                    {
+                        "name": "color",
+                        "annotation": "<class 'str'>",
+                        "default": "'red'",
+                    },
+                ],
+                "docstring": "Returns a list of `n` red fruit",
+                "return_annotation": list[str],
+            },
+            "Function arguments": {"n": 3, "color": "red"},
+            "Additional context": None,
+        }
+
+    def test_docstring_rendered_per_call(self):
+        first = list_fruit.as_task(3, color="green")
+        second = list_fruit.as_task(2, color="yellow")
+        assert (
+            first.context["Function definition"]["docstring"]
+            == "Returns a list of `n` green fruit"
+        )
+        assert (
+            second.context["Function definition"]["docstring"]
+            == "Returns a list of `n` yellow fruit"
+        )
+        assert second.context["Function arguments"] == {"n": 2, "color": "yellow"}
+
+    def test_no_return_annotation(self):
+        task = describe.as_task(1, _instructions="Be brief")
+        assert task.result_type is str
+        assert list(task.context) == [
+            "JSON result",
+            "Function definition",
+            "Function arguments",
+            "Additional context",
+            "Additional instructions",
+        ]
+        assert task.context["Additional context"] == "x is a number"
+        assert task.context["Additional instructions"] == "Be brief"
+
+
+class TestCall:
+    def test_sync_call_binds_arguments_immediately(self):
+        with pytest.raises(TypeError, match="missing a required argument"):
+            list_fruit()
+
+    async def test_async_call_returns_coroutine(self):
+        coro = list_fruit_async()
+        assert inspect.iscoroutine(coro)
+        with pytest.raises(TypeError, match="missing a required argument"):
+            await coro
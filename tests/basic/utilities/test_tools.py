@@ -1,6 +1,10 @@
+import functools
+import inspect
+
+import pydantic_ai
 import pytest
 
-from marvin.utilities.tools import update_fn
+from marvin.utilities.tools import update_fn, wrap_tool_errors
 
 
 def test_update_fn_sync_decorator_positional():
@@ -88,3 +92,87 @@ def test_update_fn_validation_missing_name_decorator():
         @update_fn()
         def my_fn(x):
             return x
+
+
+def test_update_fn_does_not_wrap_functions():
+    """Test that functions are copied rather than wrapped"""
+
+    def original(x: int, *, y: int = 1) -> int:
+        """Original docstring"""
+        return x + y
+
+    renamed = update_fn(original, name="renamed", description="New docstring")
+    assert renamed.__code__ is original.__code__
+    assert renamed(1, y=2) == 3
+    assert inspect.signature(renamed) == inspect.signature(original)
+
+    # the original function is unchanged
+    assert original.__name__ == "original"
+    assert original.__doc__ == "Original docstring"
+    assert renamed.__doc__ == "New docstring"
+
+
+async def test_update_fn_bound_method():
+    """Test update_fn on bound methods keeps them bound"""
+
+    class Adder:
+        def __init__(self, n: int):
+            self.n = n
+
+        async def add(self, x: int) -> int:
+            return x + self.n
+
+    adder = Adder(5)
+    renamed = update_fn(adder.add, name="add_five", description="Adds five")
+    assert renamed.__name__ == "add_five"
+    assert renamed.__doc__ == "Adds five"
+    assert list(inspect.signature(renamed).parameters) == ["x"]
+    assert await renamed(1) == 6
+    assert adder.add.__name__ == "add"
+
+
+def test_update_fn_other_callables():
+    """Test update_fn on callables that are not plain functions"""
+    renamed = update_fn(functools.partial(pow, 2), name="two_to_the")
+    assert renamed.__name__ == "two_to_the"
+    assert renamed(3) == 8
+
+
+def test_wrap_tool_errors_sync():
+    """Test that sync tool errors are raised as ModelRetry"""
+
+    def failing_tool(x: int) -> int:
+        raise ValueError(f"bad value {x}")
+
+    wrapped = wrap_tool_errors(failing_tool)
+    with pytest.raises(pydantic_ai.ModelRetry, match="Tool failed: bad value 1") as exc:
+        wrapped(1)
+    assert isinstance(exc.value.__cause__, ValueError)
+
+
+async def test_wrap_tool_errors_async():
+    """Test that async tool errors are raised as ModelRetry"""
+
+    async def failing_tool(x: int) -> int:
+        raise ValueError(f"bad value {x}")
+
+    wrapped = wrap_tool_errors(failing_tool)
+    with pytest.raises(pydantic_ai.ModelRetry, match="Tool failed: bad value 1"):
+        await wrapped(1)
+
+
+def test_wrap_tool_errors_passes_through_model_retry():
+    """Test that ModelRetry errors are re-raised unchanged"""
+    retry = pydantic_ai.ModelRetry("try again")
+
+    def retrying_tool() -> None:
+        raise retry
+
+    with pytest.raises(pydantic_ai.ModelRetry) as exc:
+        wrap_tool_errors(retrying_tool)()
+    assert exc.value is retry
+
+
+def test_wrap_tool_errors_success():
+    """Test that successful tool calls return their result"""
+    assert wrap_tool_errors(lambda x: x + 1)(1) == 2
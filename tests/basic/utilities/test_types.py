@@ -3,8 +3,10 @@ from typing import Literal
 
 import pytest
 
+from marvin.utilities.jinja import jinja_env
 from marvin.utilities.types import (
     Labels,
+    PythonFunction,
     as_classifier,
     is_classifier,
 )
@@ -132,3 +134,39 @@ class TestClassification:
             1: "42",
             2: "True",
         }
+
+
+def greet(name: str, punctuation: str = "!") -> str:
+    """Greets {{ name }}"""
+    return f"extra context for {name}"
+
+
+class TestPythonFunction:
+    def test_bind_call_matches_from_function_call(self):
+        python_function = PythonFunction.from_function(greet)
+        bound = python_function.bind_call("Ford")
+        expected = PythonFunction.from_function_call(greet, "Ford")
+
+        assert bound == expected
+        assert bound.docstring == "Greets Ford"
+        assert bound.bound_parameters == {"name": "Ford", "punctuation": "!"}
+        assert bound.return_value == "extra context for Ford"
+
+    def test_bind_call_does_not_modify_original(self):
+        python_function = PythonFunction.from_function(greet)
+        python_function.bind_call("Ford")
+        python_function.bind_call("Arthur", punctuation="?")
+
+        assert python_function.docstring == "Greets {{ name }}"
+        assert python_function.bound_parameters == {}
+        assert python_function.return_value is None
+
+    def test_docstring_template_compiled_once(self, monkeypatch):
+        python_function = PythonFunction.from_function(greet)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("docstring recompiled")
+
+        monkeypatch.setattr(jinja_env, "from_string", fail)
+        assert python_function.bind_call("Ford").docstring == "Greets Ford"
+        assert python_function.bind_call("Arthur").docstring == "Greets Arthur"
@@ -101,8 +101,7 @@ def setup_test_db(monkeypatch: pytest.MonkeyPatch, worker_id: str):
 
         settings.database_url = original_path
         # Clear engine cache
-        database._engine_cache.clear()
-        database._async_engine_cache.clear()
+        database.reset_engines()
 
 
 @pytest.fixture
@@ -1,5 +1,9 @@
+import logging
+
 import pytest
 
+import marvin
+import marvin.utilities.logging
 from marvin.settings import Settings
 
 
@@ -28,3 +32,42 @@ def test_database_url_set_from_env_var(
     else:
         assert settings.database_url is not None
         assert settings.database_url.endswith(expected_ending)
+
+
+def test_log_level_assignment_configures_logging():
+    settings = Settings(log_level="INFO")
+    logger = logging.getLogger("marvin")
+    handlers = list(logger.handlers)
+
+    # Unrelated assignments leave the handlers alone
+    settings.agent_retries = 3
+    assert logger.handlers == handlers
+
+    try:
+        settings.log_level = "debug"  # type: ignore[assignment]
+        assert settings.log_level == "DEBUG"
+        assert logger.level == logging.DEBUG
+    finally:
+        settings.log_level = marvin.settings.log_level
+
+
+def test_same_log_level_keeps_handlers():
+    logger = logging.getLogger("marvin")
+    handlers = list(logger.handlers)
+
+    Settings(log_level=marvin.settings.log_level)
+    assert logger.handlers == handlers
+
+
+def test_log_level_applies_after_direct_setup():
+    settings = Settings(log_level="INFO")
+    logger = logging.getLogger("marvin")
+
+    try:
+        marvin.utilities.logging.setup_logging("DEBUG")
+        assert logger.level == logging.DEBUG
+
+        settings.log_level = "INFO"
+        assert logger.level == logging.INFO
+    finally:
+        marvin.utilities.logging.setup_logging(marvin.settings.log_level)